@@ -3,7 +3,7 @@
 import dataclasses
 from collections import OrderedDict
 from pathlib import Path
-from typing import Sequence, Set, Tuple, Any
+from typing import Any, Dict, List, Sequence, Set, Tuple
 
 import h5py as h5
 import numpy as np
@@ -14,6 +14,16 @@ from ..environment import PandemicSimOpts
 
 __all__ = ['H5DataLoader']
 
+_CHUNK_CACHE_NBYTES = 16 * 1024 * 1024
+
+
+def _read_dataset(dataset: h5.Dataset) -> np.ndarray:
+    """Read a whole dataset with a single direct read into a preallocated array."""
+    out = np.empty(dataset.shape, dtype=dataset.dtype)
+    if out.size > 0:
+        dataset.read_direct(out)
+    return out
+
 
 class H5DataLoader(ExperimentDataLoader):
     """Implement a H5 experiment data loader"""
@@ -30,9 +40,12 @@ class H5DataLoader(ExperimentDataLoader):
         self._pandemic_sim_opts_field_names = {f.name for f in dataclasses.fields(PandemicSimOpts)}
 
     def get_data(self) -> Sequence[ExperimentResult]:
-        res = OrderedDict()
+        res: Dict[Any, ExperimentResult] = OrderedDict()
+        # trajectories of all the seeds of an experiment, concatenated once all the trials are read
+        obs_trajectories: Dict[Any, Dict[str, List[np.ndarray]]] = dict()
+        reward_trajectories: Dict[Any, List[np.ndarray]] = dict()
 
-        with h5.File(self._filename, mode='r') as f:
+        with h5.File(self._filename, mode='r', rdcc_nbytes=_CHUNK_CACHE_NBYTES) as f:
             for trial_key in f.keys():
                 group = f[trial_key]
                 sim_opts_data = dict()
@@ -60,8 +73,8 @@ class H5DataLoader(ExperimentDataLoader):
                     if k in self._pandemic_sim_opts_field_names:
                         sim_opts_data[k] = tuple(v) if isinstance(v, np.ndarray) else v
 
-                pandemic_obs = {k: v[:] for k, v in group['observation'].items()}
-                rewards = np.atleast_3d(group['reward'][:])
+                pandemic_obs = {k: _read_dataset(v) for k, v in group['observation'].items()}
+                rewards = np.atleast_3d(_read_dataset(group['reward']))
 
                 sim_opts = PandemicSimOpts(**sim_opts_data)
 
@@ -79,13 +92,18 @@ class H5DataLoader(ExperimentDataLoader):
                                                 reward_trajectories=rewards,
                                                 strategy=strategy,
                                                 num_persons=num_persons)
+                    obs_trajectories[key] = {k: [v] for k, v in pandemic_obs.items()}
+                    reward_trajectories[key] = [rewards]
                 else:
                     res[key].seeds.append(seed)
-
                     for k, v in pandemic_obs.items():
-                        pandemic_obs[k] = np.hstack((getattr(res[key].obs_trajectories, k), v))
-
-                    res[key].obs_trajectories = PandemicObservation(**pandemic_obs)
-                    res[key].reward_trajectories = np.hstack((res[key].reward_trajectories, rewards))
+                        obs_trajectories[key][k].append(v)
+                    reward_trajectories[key].append(rewards)
+
+        for key, result in res.items():
+            if len(result.seeds) > 1:
+                result.obs_trajectories = PandemicObservation(**{k: np.concatenate(v, axis=1)
+                                                                 for k, v in obs_trajectories[key].items()})
+                result.reward_trajectories = np.concatenate(reward_trajectories[key], axis=1)
 
         return list(res.values())
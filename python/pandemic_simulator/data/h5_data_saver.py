@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import h5py as h5
 import numpy as np
@@ -13,6 +13,22 @@ from ..utils import shallow_asdict
 
 __all__ = ['H5DataSaver']
 
+_CHUNK_NBYTES = 1 << 20
+
+
+def _chunk_shape(shape: Tuple[int, ...], itemsize: int) -> Optional[Tuple[int, ...]]:
+    """Return a chunk shape of about _CHUNK_NBYTES (along the time axis, clipped to the dataset shape) or None for
+    empty datasets that cannot be chunked."""
+    if len(shape) == 0 or 0 in shape:
+        return None
+    row_nbytes = itemsize * int(np.prod(shape[1:]))
+    return (min(shape[0], max(1, _CHUNK_NBYTES // row_nbytes)),) + tuple(shape[1:])
+
+
+def _create_dataset(group: h5.Group, name: str, data: np.ndarray) -> None:
+    chunks = _chunk_shape(data.shape, data.dtype.itemsize)
+    group.create_dataset(name, data=data, chunks=chunks, compression='lzf' if chunks else None)
+
 
 class H5DataSaver(ExperimentDataSaver):
     """Implement a H5 experiment data saver"""
@@ -21,6 +37,7 @@ class H5DataSaver(ExperimentDataSaver):
     _f: h5.File
     _obs: Dict[str, np.ndarray]
     _rewards: Optional[np.ndarray]
+    _num_groups: int
 
     def __init__(self, filename: str, path: Path = Path('.'), overwrite: bool = False) -> None:
         """
@@ -35,6 +52,7 @@ class H5DataSaver(ExperimentDataSaver):
         self._f = h5.File(self._filename, mode='w')
         self._obs = dict()
         self._rewards = None
+        self._num_groups = 0
 
     def begin(self, obs: PandemicObservation) -> None:
         self._obs = dict(**shallow_asdict(obs))
@@ -53,16 +71,18 @@ class H5DataSaver(ExperimentDataSaver):
             # skip since infection never went about threshold
             return False
 
-        g = self._f.create_group(time.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        # the counter keeps the group names unique (and sorted) when episodes are finalized within the same second
+        g = self._f.create_group(f"{time.strftime('%Y-%m-%dT%H:%M:%SZ')}_{self._num_groups:06d}")
+        self._num_groups += 1
 
         g.attrs.update(**kwargs)
         obs = g.create_group('observation')
 
         for k, v in self._obs.items():
-            obs.create_dataset(k, data=v.astype('float32') if v.dtype == 'O' else v)
+            _create_dataset(obs, k, v.astype('float32') if v.dtype == 'O' else v)
 
         if self._rewards is not None:
-            g.create_dataset('reward', data=self._rewards)
+            _create_dataset(g, 'reward', self._rewards)
 
         self._f.flush()
         return True
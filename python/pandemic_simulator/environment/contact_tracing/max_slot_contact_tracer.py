@@ -1,11 +1,11 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 
-from orderedset import OrderedSet
-from typing import Dict, FrozenSet, List, Mapping, Set
+from typing import Dict, FrozenSet, List, Mapping
 
 import numpy as np
 
 from ..interfaces import ContactTracer, PersonID
+from ...utils import OrderedSet
 
 __all__ = ['MaxSlotContactTracer']
 
@@ -19,7 +19,7 @@ class MaxSlotContactTracer(ContactTracer):
     _storage_slots: int
     _time_slot_scale: int
     _memory: List[Dict[FrozenSet[PersonID], int]]
-    _indices: List[Dict[PersonID, Set[FrozenSet[PersonID]]]]
+    _indices: List[Dict[PersonID, OrderedSet[FrozenSet[PersonID]]]]
 
     def __init__(self, storage_slots: int = 5, time_slot_scale: int = 24):
         """
@@ -35,8 +35,8 @@ class MaxSlotContactTracer(ContactTracer):
         """
         Adds a new time slot to the contact tracing (e.g., a new day, or a new hour, depending on the granularity).
         """
-        self._memory = np.roll(self._memory, 1)
-        self._indices = np.roll(self._indices, 1)
+        self._memory = self._memory[-1:] + self._memory[:-1]
+        self._indices = self._indices[-1:] + self._indices[:-1]
         self._memory[0] = dict()
         self._indices[0] = dict()
 
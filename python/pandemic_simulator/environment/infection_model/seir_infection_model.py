@@ -297,7 +297,7 @@ class SEIRModel(InfectionModel):
             if len(state_probs) != 0:
                 probs = np.array(list(state_probs.values()))
                 assert abs(1. - sum(probs)) < 1e-3, f'Probabilities {probs} do not sum to one'
-                label = self._numpy_rng.choice(list(state_probs.keys()), p=probs)
+                label = self._numpy_rng.choice(list(state_probs.keys()), p=probs)  # type: ignore[arg-type]
 
         return SEIRInfectionState(summary=self._seir_to_summary[label],
                                   spread_probability=subject_state.spread_probability,
@@ -4,9 +4,9 @@ from abc import ABC, abstractmethod
 from typing import Mapping
 
 import numpy as np
-from orderedset import OrderedSet
 
 from .ids import PersonID
+from ...utils import OrderedSet
 
 __all__ = ['ContactTracer']
 
@@ -4,10 +4,9 @@
 from dataclasses import dataclass, field
 from typing import Set
 
-from orderedset import OrderedSet
-
 from .ids import PersonID
 from .sim_time import SimTimeTuple
+from ...utils import OrderedSet
 
 __all__ = ['LocationState', 'ContactRate', 'NonEssentialBusinessLocationState',
            'BusinessLocationState']
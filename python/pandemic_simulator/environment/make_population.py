@@ -30,8 +30,8 @@ def get_us_age_distribution(num_persons: int) -> List[int]:
 
 
 def infection_risk(age: int) -> Risk:
-    return cast(Risk,
-                globals.numpy_rng.choice([Risk.LOW, Risk.HIGH], p=[1 - age / age_group.stop, age / age_group.stop]))
+    return cast(Risk, globals.numpy_rng.choice([Risk.LOW, Risk.HIGH],  # type: ignore[arg-type]
+                                               p=[1 - age / age_group.stop, age / age_group.stop]))
 
 
 def make_population(sim_config: PandemicSimConfig) -> List[Person]:
@@ -83,7 +83,7 @@ def make_population(sim_config: PandemicSimConfig) -> List[Person]:
             retiree_ages.append(age)
 
     all_homes = list(registry.location_ids_of_type(Home))
-    numpy_rng.shuffle(all_homes)
+    numpy_rng.shuffle(all_homes)  # type: ignore[arg-type]
     unassigned_homes = all_homes
 
     # a) Select 6.5% of retirees (age > 65) and cluster them as groups of 1 or 2 and assign each
@@ -113,7 +113,7 @@ def make_population(sim_config: PandemicSimConfig) -> List[Person]:
     for home, age in minor_homes_ages:
         persons.append(Minor(person_id=PersonID(f'minor_{str(uuid4())}', age),
                              home=home,
-                             school=numpy_rng.choice(schools) if len(schools) > 0 else None,
+                             school=numpy_rng.choice(schools) if len(schools) > 0 else None,  # type: ignore[arg-type]
                              regulation_compliance_prob=sim_config.regulation_compliance_prob,
                              init_state=PersonState(current_location=home, risk=infection_risk(age))))
 
@@ -129,7 +129,7 @@ def make_population(sim_config: PandemicSimConfig) -> List[Person]:
 
     non_single_parent_minor_homes = minor_homes[int(len(minor_homes) * 0.23):]
     homes_to_distribute = unassigned_homes + non_single_parent_minor_homes
-    numpy_rng.shuffle(homes_to_distribute)
+    numpy_rng.shuffle(homes_to_distribute)  # type: ignore[arg-type]
     unassigned_adult_ages = adult_ages[len(minor_homes):]
     for i in range(len(unassigned_retiree_ages) + len(unassigned_adult_ages)):
         home = homes_to_distribute[i % len(homes_to_distribute)]
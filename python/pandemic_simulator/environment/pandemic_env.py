@@ -5,7 +5,7 @@ import gym
 
 from .done import DoneFunction
 from .interfaces import LocationID, PandemicObservation, NonEssentialBusinessLocationState, PandemicRegulation, \
-    InfectionSummary
+    InfectionSummary, globals
 from .pandemic_sim import PandemicSim
 from .reward import RewardFunction, SumReward, RewardFunctionFactory, RewardFunctionType
 from .simulator_config import PandemicSimConfig
@@ -156,6 +156,19 @@ class PandemicGymEnv(gym.Env):
 
         return self._last_observation, self._last_reward, done, {}
 
+    def seed(self, seed: Optional[int] = None) -> List[Optional[int]]:
+        """
+        Reseed the global numpy random state in place. All the simulator components share this random state, so
+        seeding followed by a reset replays the infection dynamics of an episode without rebuilding the locations and
+        the population. The registry's global location summary (visit statistics) is not reset and keeps
+        accumulating across episodes.
+
+        :param seed: numpy random seed
+        :return: list of the seeds used
+        """
+        globals.numpy_rng.seed(seed)
+        return [seed]
+
     def reset(self) -> PandemicObservation:
         self._pandemic_sim.reset()
         self._last_observation = PandemicObservation.create_empty(
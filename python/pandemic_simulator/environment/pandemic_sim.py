@@ -2,10 +2,9 @@
 
 from collections import defaultdict, OrderedDict
 from itertools import product as cartesianproduct, combinations
-from typing import DefaultDict, Dict, List, Optional, Sequence, cast, Type
+from typing import Callable, DefaultDict, Dict, List, Optional, Sequence, cast, Type
 
 import numpy as np
-from orderedset import OrderedSet
 
 from .contact_tracing import MaxSlotContactTracer
 from .infection_model import SEIRModel, SpreadProbabilityParams
@@ -18,6 +17,7 @@ from .make_population import make_population
 from .pandemic_testing_strategies import RandomPandemicTesting
 from .simulator_config import PandemicSimConfig
 from .simulator_opts import PandemicSimOpts
+from ..utils import OrderedSet, trange
 
 __all__ = ['PandemicSim', 'make_locations']
 
@@ -326,6 +326,24 @@ class PandemicSim:
         for _ in range(hours_in_a_day):
             self.step()
 
+    def step_days(self,
+                  num_days: int,
+                  hours_in_a_day: int = 24,
+                  on_day: Optional[Callable[[PandemicSimState], None]] = None,
+                  desc: Optional[str] = None) -> None:
+        """
+        Run the simulator for num_days days.
+
+        :param num_days: Number of days to simulate.
+        :param hours_in_a_day: Number of hours in a day.
+        :param on_day: An optional callback that is called with the sim state at the end of each day.
+        :param desc: If given, a progress bar with this description is shown.
+        """
+        for _ in (range(num_days) if desc is None else trange(num_days, desc=desc)):
+            self.step_day(hours_in_a_day)
+            if on_day is not None:
+                on_day(self._state)
+
     @staticmethod
     def _get_cr_from_social_distancing(location: Location,
                                        social_distancing: float) -> ContactRate:
@@ -388,6 +406,8 @@ class PandemicSim:
             person.reset()
 
         self._infection_model.reset()
+        if self._contact_tracer:
+            self._contact_tracer.reset()
 
         num_persons = len(self._id_to_person)
         self._state = PandemicSimState(
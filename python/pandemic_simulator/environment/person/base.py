@@ -49,7 +49,7 @@ class BasePerson(Person):
         self._regulation_compliance_prob = regulation_compliance_prob
         self._init_state = init_state or PersonState(infection_state=None,
                                                      current_location=home,
-                                                     risk=self._numpy_rng.choice([r for r in Risk]),
+                                                     risk=self._numpy_rng.choice(list(Risk)),  # type: ignore[arg-type]
                                                      infection_spread_multiplier=self._regulation_compliance_prob)
 
         self._state = deepcopy(self._init_state)
@@ -4,7 +4,7 @@ import os
 from pathlib import Path
 from typing import Dict, Optional, Sequence, Union, List
 
-from .experiments import experiment_main
+from .experiments import experiment_main, worker_pool
 from .sim_configs import small_town_config, medium_town_config, above_medium_town_config
 from ..data import H5DataSaver, StageSchedule
 from ..environment import PandemicSimOpts, PandemicSimConfig, PandemicRegulation, Risk
@@ -37,6 +37,7 @@ class EvaluationOpts:
     data_saver_path: Path = Path('../results/')
     data_filename: str = dataclasses.field(init=False)
     render_runs: bool = False
+    num_workers: int = 1
 
     def __post_init__(self) -> None:
         os.makedirs(str(self.data_saver_path.absolute()), exist_ok=True)
@@ -46,36 +47,40 @@ def evaluate_strategies(exp_name: str, eval_opts: EvaluationOpts) -> None:
     assert eval_opts.strategies is not None
     data_saver = H5DataSaver(exp_name, path=eval_opts.data_saver_path)
 
-    for i, strategy in enumerate(eval_opts.strategies):
-        stage_schedule = [StageSchedule(stage=strategy, end_day=None)] if isinstance(strategy, int) else strategy
+    with worker_pool(eval_opts.num_workers) as pool:
+        for i, strategy in enumerate(eval_opts.strategies):
+            stage_schedule = [StageSchedule(stage=strategy, end_day=None)] if isinstance(strategy, int) else strategy
 
-        txt_strategy = [f'(stage: {s.stage} end: {s.end_day})' for s in stage_schedule]
-        sim_opts = eval_opts.sim_opts[i] if eval_opts.sim_opts is not None else PandemicSimOpts()
+            txt_strategy = [f'(stage: {s.stage} end: {s.end_day})' for s in stage_schedule]
+            sim_opts = eval_opts.sim_opts[i] if eval_opts.sim_opts is not None else PandemicSimOpts()
 
-        print(f'Evaluating strategy - {", ".join(txt_strategy)}')
-        experiment_main(sim_config=eval_opts.default_sim_config,
-                        sim_opts=sim_opts,
-                        data_saver=data_saver,
-                        pandemic_regulations=eval_opts.pandemic_regulations,
-                        stages_to_execute=strategy,
-                        enable_warm_up=eval_opts.enable_warm_up,
-                        num_random_seeds=eval_opts.num_seeds,
-                        max_episode_length=eval_opts.max_episode_length,
-                        exp_id=i)
+            print(f'Evaluating strategy - {", ".join(txt_strategy)}')
+            experiment_main(sim_config=eval_opts.default_sim_config,
+                            sim_opts=sim_opts,
+                            data_saver=data_saver,
+                            pandemic_regulations=eval_opts.pandemic_regulations,
+                            stages_to_execute=strategy,
+                            enable_warm_up=eval_opts.enable_warm_up,
+                            num_random_seeds=eval_opts.num_seeds,
+                            max_episode_length=eval_opts.max_episode_length,
+                            pool=pool,
+                            exp_id=i)
 
 
 def evaluate_spread_rates(exp_name: str, eval_opts: EvaluationOpts) -> None:
     assert eval_opts.spread_rates is not None
     data_saver = H5DataSaver(exp_name, path=eval_opts.data_saver_path)
-    for i, spread_rate in enumerate(eval_opts.spread_rates):
-        print(f'Evaluating spread_rate - {spread_rate}')
-        sim_opts = PandemicSimOpts(infection_spread_rate_mean=spread_rate)
-        experiment_main(sim_config=eval_opts.default_sim_config,
-                        sim_opts=sim_opts,
-                        data_saver=data_saver,
-                        num_random_seeds=eval_opts.num_seeds,
-                        max_episode_length=eval_opts.max_episode_length,
-                        exp_id=i)
+    with worker_pool(eval_opts.num_workers) as pool:
+        for i, spread_rate in enumerate(eval_opts.spread_rates):
+            print(f'Evaluating spread_rate - {spread_rate}')
+            sim_opts = PandemicSimOpts(infection_spread_rate_mean=spread_rate)
+            experiment_main(sim_config=eval_opts.default_sim_config,
+                            sim_opts=sim_opts,
+                            data_saver=data_saver,
+                            num_random_seeds=eval_opts.num_seeds,
+                            max_episode_length=eval_opts.max_episode_length,
+                            pool=pool,
+                            exp_id=i)
 
 
 def evaluate_testing_rates(exp_name: str, eval_opts: EvaluationOpts) -> None:
@@ -83,19 +88,21 @@ def evaluate_testing_rates(exp_name: str, eval_opts: EvaluationOpts) -> None:
     data_saver = H5DataSaver(exp_name, path=eval_opts.data_saver_path)
     def_sim_opts = PandemicSimOpts()
 
-    for i, parameter_scale in enumerate(eval_opts.pandemic_test_rate_scales):
-        print(f'Evaluating testing_rate_scale - {parameter_scale}')
-        sim_opts = PandemicSimOpts(spontaneous_testing_rate=def_sim_opts.spontaneous_testing_rate * parameter_scale,
-                                   symp_testing_rate=def_sim_opts.symp_testing_rate * parameter_scale,
-                                   retest_rate=def_sim_opts.retest_rate * parameter_scale)
-        experiment_main(sim_config=eval_opts.default_sim_config,
-                        sim_opts=sim_opts,
-                        data_saver=data_saver,
-                        pandemic_regulations=[PandemicRegulation(stay_home_if_sick=True, stage=0)],
-                        stages_to_execute=0,
-                        num_random_seeds=eval_opts.num_seeds,
-                        max_episode_length=eval_opts.max_episode_length,
-                        exp_id=i)
+    with worker_pool(eval_opts.num_workers) as pool:
+        for i, parameter_scale in enumerate(eval_opts.pandemic_test_rate_scales):
+            print(f'Evaluating testing_rate_scale - {parameter_scale}')
+            sim_opts = PandemicSimOpts(spontaneous_testing_rate=def_sim_opts.spontaneous_testing_rate * parameter_scale,
+                                       symp_testing_rate=def_sim_opts.symp_testing_rate * parameter_scale,
+                                       retest_rate=def_sim_opts.retest_rate * parameter_scale)
+            experiment_main(sim_config=eval_opts.default_sim_config,
+                            sim_opts=sim_opts,
+                            data_saver=data_saver,
+                            pandemic_regulations=[PandemicRegulation(stay_home_if_sick=True, stage=0)],
+                            stages_to_execute=0,
+                            num_random_seeds=eval_opts.num_seeds,
+                            max_episode_length=eval_opts.max_episode_length,
+                            pool=pool,
+                            exp_id=i)
 
 
 def evaluate_social_gatherings(exp_name: str, eval_opts: EvaluationOpts) -> None:
@@ -105,16 +112,18 @@ def evaluate_social_gatherings(exp_name: str, eval_opts: EvaluationOpts) -> None
         PandemicRegulation(risk_to_avoid_gathering_size={Risk.LOW: ags, Risk.HIGH: ags}, stage=stage)
         for stage, ags in enumerate(eval_opts.avoid_gathering_sizes)]
 
-    for i, cr in enumerate(pandemic_regulations):
-        print(f'Evaluating social_gathering_size_to_avoid - {cr.risk_to_avoid_gathering_size[Risk.LOW]}')
-        experiment_main(sim_config=eval_opts.default_sim_config,
-                        sim_opts=PandemicSimOpts(),
-                        data_saver=data_saver,
-                        pandemic_regulations=pandemic_regulations,
-                        stages_to_execute=cr.stage,
-                        num_random_seeds=eval_opts.num_seeds,
-                        max_episode_length=eval_opts.max_episode_length,
-                        exp_id=i)
+    with worker_pool(eval_opts.num_workers) as pool:
+        for i, cr in enumerate(pandemic_regulations):
+            print(f'Evaluating social_gathering_size_to_avoid - {cr.risk_to_avoid_gathering_size[Risk.LOW]}')
+            experiment_main(sim_config=eval_opts.default_sim_config,
+                            sim_opts=PandemicSimOpts(),
+                            data_saver=data_saver,
+                            pandemic_regulations=pandemic_regulations,
+                            stages_to_execute=cr.stage,
+                            num_random_seeds=eval_opts.num_seeds,
+                            max_episode_length=eval_opts.max_episode_length,
+                            pool=pool,
+                            exp_id=i)
 
 
 def evaluate_location_contact_rates(exp_name: str, eval_opts: EvaluationOpts) -> None:
@@ -122,27 +131,31 @@ def evaluate_location_contact_rates(exp_name: str, eval_opts: EvaluationOpts) ->
     data_saver = H5DataSaver(exp_name, path=eval_opts.data_saver_path)
     pandemic_regulations = [PandemicRegulation(social_distancing=sd, stage=stage)
                             for stage, sd in enumerate(eval_opts.social_distancing)]
-    for i, cr in enumerate(pandemic_regulations):
-        print(f'Evaluating social_distancing - {cr.social_distancing}')
-        experiment_main(sim_config=eval_opts.default_sim_config,
-                        sim_opts=PandemicSimOpts(),
-                        data_saver=data_saver,
-                        pandemic_regulations=pandemic_regulations,
-                        stages_to_execute=cr.stage,
-                        num_random_seeds=eval_opts.num_seeds,
-                        max_episode_length=eval_opts.max_episode_length,
-                        exp_id=i)
+    with worker_pool(eval_opts.num_workers) as pool:
+        for i, cr in enumerate(pandemic_regulations):
+            print(f'Evaluating social_distancing - {cr.social_distancing}')
+            experiment_main(sim_config=eval_opts.default_sim_config,
+                            sim_opts=PandemicSimOpts(),
+                            data_saver=data_saver,
+                            pandemic_regulations=pandemic_regulations,
+                            stages_to_execute=cr.stage,
+                            num_random_seeds=eval_opts.num_seeds,
+                            max_episode_length=eval_opts.max_episode_length,
+                            pool=pool,
+                            exp_id=i)
 
 
 def evaluate_population_sizes(exp_name: str, eval_opts: EvaluationOpts) -> None:
     assert eval_opts.population_sizes is not None
     data_saver = H5DataSaver(exp_name, path=eval_opts.data_saver_path)
 
-    for i, population_size in enumerate(eval_opts.population_sizes):
-        print(f'Evaluating population_size - {population_size}')
-        experiment_main(sim_config=population_size_to_config[population_size],
-                        sim_opts=PandemicSimOpts(),
-                        data_saver=data_saver,
-                        num_random_seeds=eval_opts.num_seeds,
-                        max_episode_length=eval_opts.max_episode_length,
-                        exp_id=i)
+    with worker_pool(eval_opts.num_workers) as pool:
+        for i, population_size in enumerate(eval_opts.population_sizes):
+            print(f'Evaluating population_size - {population_size}')
+            experiment_main(sim_config=population_size_to_config[population_size],
+                            sim_opts=PandemicSimOpts(),
+                            data_saver=data_saver,
+                            num_random_seeds=eval_opts.num_seeds,
+                            max_episode_length=eval_opts.max_episode_length,
+                            pool=pool,
+                            exp_id=i)
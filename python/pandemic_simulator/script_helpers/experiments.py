@@ -1,17 +1,71 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 
-from typing import List, Optional, Sequence, Union
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from multiprocessing.pool import Pool
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from tqdm import trange
 
 from .covid_regulations import austin_regulations
 from ..data.interfaces import ExperimentDataSaver, StageSchedule
 from ..environment import PandemicSimOpts, PandemicSimConfig, NoPandemicDone, PandemicRegulation, init_globals, \
-    PandemicGymEnv
-from ..utils import shallow_asdict
+    PandemicGymEnv, PandemicObservation
+from ..utils import shallow_asdict, trange
 
-__all__ = ['experiment_main', 'seeded_experiment_main']
+__all__ = ['experiment_main', 'seeded_experiment_main', 'worker_pool']
+
+
+class _BufferedDataSaver(ExperimentDataSaver):
+    """A data saver that buffers an episode in memory so that it can be replayed into another data saver (possibly
+    in a different process)."""
+
+    _begin_obs: Optional[PandemicObservation]
+    _records: List[Tuple[PandemicObservation, Optional[Union[np.ndarray, float]]]]
+    _finalize_kwargs: Dict[str, Any]
+
+    def __init__(self) -> None:
+        self._begin_obs = None
+        self._records = []
+        self._finalize_kwargs = dict()
+
+    def begin(self, obs: PandemicObservation) -> None:
+        # PandemicGymEnv builds a new observation every step and never mutates a returned one, so references suffice
+        self._begin_obs = obs
+        self._records = []
+
+    def record(self, obs: PandemicObservation, reward: Optional[Union[np.ndarray, float]] = None) -> None:
+        self._records.append((obs, reward))
+
+    def finalize(self, **kwargs: Any) -> bool:
+        self._finalize_kwargs = kwargs
+        return True
+
+    def replay(self, data_saver: ExperimentDataSaver) -> bool:
+        """Replay the buffered episode into the given data saver and return the result of its finalize."""
+        assert self._begin_obs is not None, 'Nothing to replay.'
+        data_saver.begin(self._begin_obs)
+        for obs, reward in self._records:
+            data_saver.record(obs, reward)
+        return data_saver.finalize(**self._finalize_kwargs)
+
+
+@contextmanager
+def worker_pool(num_workers: int) -> Iterator[Optional[Pool]]:
+    """A context manager that provides a pool of worker processes to share across experiment_main calls or None if
+    num_workers <= 1 (sequential runs)."""
+    if num_workers > 1:
+        with Pool(num_workers) as pool:
+            yield pool
+    else:
+        yield None
+
+
+def _buffered_seeded_experiment_main(random_seed: int, **kwargs: Any) -> _BufferedDataSaver:
+    data_saver = _BufferedDataSaver()
+    # the workers share the terminal, their progress bars would be drawn over each other
+    seeded_experiment_main(data_saver=data_saver, random_seed=random_seed, show_progress=False, **kwargs)
+    return data_saver
 
 
 def seeded_experiment_main(exp_id: int,
@@ -22,7 +76,8 @@ def seeded_experiment_main(exp_id: int,
                            stages_to_execute: Union[int, Sequence[StageSchedule]] = 0,
                            enable_warm_up: bool = False,
                            max_episode_length: int = 120,
-                           random_seed: int = 0) -> bool:
+                           random_seed: int = 0,
+                           show_progress: bool = True) -> bool:
     """A helper that runs an experiment with the given seed and records data"""
     init_globals(seed=random_seed)
     env = PandemicGymEnv.from_config(sim_config=sim_config,
@@ -41,7 +96,7 @@ def seeded_experiment_main(exp_id: int,
 
     stage_idx = 0
     warm_up_done = not enable_warm_up
-    for i in trange(max_episode_length, desc='Simulating day'):
+    for i in (trange(max_episode_length, desc='Simulating day') if show_progress else range(max_episode_length)):
 
         if not env.observation.infection_above_threshold and not warm_up_done:
             stage = 0
@@ -73,10 +128,42 @@ def experiment_main(exp_id: int,
                     stages_to_execute: Union[int, Sequence[StageSchedule]] = 0,
                     enable_warm_up: bool = False,
                     max_episode_length: int = 120,
-                    num_random_seeds: int = 5) -> None:
-    """A helper that runs multi-seeded experiments and records data."""
+                    num_random_seeds: int = 5,
+                    num_workers: int = 1,
+                    pool: Optional[Pool] = None) -> None:
+    """A helper that runs multi-seeded experiments and records data.
+
+    With num_workers > 1 or a worker pool (see worker_pool), the seeds are run in parallel worker processes and their
+    data is recorded by the main process in seed order, so the saved data is the same as with a sequential run.
+    """
     rng = np.random.RandomState(seed=0)
     num_evaluated_seeds = 0
+
+    if pool is not None or num_workers > 1:
+        run_seed = partial(_buffered_seeded_experiment_main,
+                           exp_id=exp_id,
+                           sim_config=sim_config,
+                           sim_opts=sim_opts,
+                           pandemic_regulations=pandemic_regulations,
+                           stages_to_execute=stages_to_execute,
+                           enable_warm_up=enable_warm_up,
+                           max_episode_length=max_episode_length)
+        # reuse the given pool, else create one for this experiment
+        pool_context: ContextManager[Optional[Pool]] = (nullcontext(pool) if pool is not None
+                                                        else worker_pool(num_workers))
+        with pool_context as seed_pool:
+            assert seed_pool is not None
+            while num_evaluated_seeds < num_random_seeds:
+                # run as many seeds as are still needed, the unsuccessful ones are replaced in the next round
+                seeds = [rng.randint(0, 100000) for _ in range(num_random_seeds - num_evaluated_seeds)]
+                print(f'Running experiment seeds: {seeds} - {num_evaluated_seeds + 1}/{num_random_seeds}')
+                for seed, buffered_data in zip(seeds, seed_pool.map(run_seed, seeds)):
+                    if buffered_data.replay(data_saver):
+                        num_evaluated_seeds += 1
+                    else:
+                        print(f'Experiment with seed {seed} did not succeed. Skipping...')
+        return
+
     while num_evaluated_seeds < num_random_seeds:
         seed = rng.randint(0, 100000)
         print(f'Running experiment seed: {seed} - {num_evaluated_seeds + 1}/{num_random_seeds}')
@@ -120,13 +120,13 @@ def make_evaluation_plots_from_data(data: Sequence[ExperimentResult],
         fig = plt.figure(num=sup_title, figsize=figsize)
 
     gs2 = gridspec.GridSpec(n_rows, n_cols)
-    axs = []
+    bar_axs = []
     plot_i = 0
     for sp in gs2:
         if plot_i < bar_plots_2d:
-            axs.append(fig.add_subplot(sp))
+            bar_axs.append(fig.add_subplot(sp))
         elif plot_i < (bar_plots_2d + bar_plots_3d):
-            axs.append(fig.add_subplot(sp, projection='3d'))
+            bar_axs.append(fig.add_subplot(sp, projection='3d'))
         plot_i += 1
 
     plot_multi_params_summary(data,
@@ -136,9 +136,9 @@ def make_evaluation_plots_from_data(data: Sequence[ExperimentResult],
                               show_cumulative_reward_plot=show_cumulative_reward,
                               show_time_to_peak=show_time_to_peak,
                               show_pandemic_duration=show_pandemic_duration,
-                              axs=axs)
+                              axs=bar_axs)
 
-    for ax in axs:
+    for ax in bar_axs:
         if ax.axison or isinstance(ax, Axes3D):
             offset = 20 if max([len(label) for label in param_labels]) < 5 else 30
             ax.annotate(f'({plot_ref_labels[plot_ref_label_i]})', (0.5, 0.), xytext=(0, -25 - offset),
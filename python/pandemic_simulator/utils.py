@@ -1,13 +1,15 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 import abc
 import dataclasses
-from typing import Any, cast, Type, TypeVar, Dict, List
+import os
+import sys
+from typing import Any, cast, Type, TypeVar, Dict, Iterable, Iterator, List, MutableSet
 
 import istype
 import numpy as np
 
 __all__ = ['required', 'abstract_class_property', 'checked_cast', 'shallow_asdict', 'cluster_into_random_sized_groups',
-           'integer_partitions']
+           'integer_partitions', 'trange', 'OrderedSet']
 
 _T = TypeVar('_T')
 
@@ -56,3 +58,50 @@ def cluster_into_random_sized_groups(orig_list: List[int],
 def integer_partitions(x: int, n_partitions: int) -> List[int]:
     _x = x // n_partitions
     return [_x + 1 if i < x % n_partitions else _x for i in range(n_partitions)]
+
+
+def trange(*args: int, **kwargs: Any) -> Iterable[int]:
+    """
+    A drop-in for tqdm.trange that returns a plain range (no progress bar overhead) if the PS_NO_TQDM environment
+    variable is set or if stderr, where tqdm draws the bar, is not attached to a terminal (e.g. CI or benchmark runs).
+    """
+    if os.environ.get('PS_NO_TQDM') or not sys.stderr.isatty():
+        return range(*args)
+
+    import tqdm  # lazy import, only needed when a progress bar is drawn
+    return cast(Iterable[int], tqdm.trange(*args, **kwargs))
+
+
+class OrderedSet(MutableSet[_T]):
+    """A set that remembers insertion order, backed by the insertion ordered builtin dict."""
+
+    _items: Dict[_T, None]
+
+    def __init__(self, items: Iterable[_T] = ()):
+        self._items = dict.fromkeys(items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrderedSet):
+            return len(self) == len(other) and list(self._items) == list(other._items)
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self._items)!r})'
+
+    def add(self, item: _T) -> None:
+        self._items[item] = None
+
+    def discard(self, item: _T) -> None:
+        self._items.pop(item, None)
+
+    def update(self, items: Iterable[_T]) -> None:
+        self._items.update(dict.fromkeys(items))
@@ -292,9 +292,9 @@ def plot_multi_params_summary(exp_results: Sequence[ExperimentResult],
     :param axs: A sequence of figure axis handles
     """
     if axs is None:
-        fig, axs = plt.subplots(2, 2, figsize=(8, 6)) if not show_testing_diff_plot else plt.subplots(3, 2,
-                                                                                                      figsize=(8, 6))
-        axs = list(np.ravel(axs))
+        fig, _axs = plt.subplots(2, 2, figsize=(8, 6)) if not show_testing_diff_plot else plt.subplots(3, 2,
+                                                                                                       figsize=(8, 6))
+        axs = list(np.ravel(_axs))
 
     ylabel_size = 8
     assert len(exp_results) == len(param_labels), f'{len(exp_results)}, {len(param_labels)}'
@@ -200,10 +200,9 @@ class SimViz(BaseMatplotLibViz):
         _vv = np.zeros((1, len(self._loc_types), len(self._person_types)))
         for i in range(len(self._loc_types)):
             for j in range(len(self._person_types)):
-                ec = state.global_location_summary[(self._loc_types[i], self._person_types[j])].entry_count
-                vc = state.global_location_summary[(self._loc_types[i], self._person_types[j])].visitor_count
-                _av[0, i, j] = ec - vc
-                _vv[0, i, j] = vc
+                summary = state.global_location_summary[(self._loc_types[i], self._person_types[j])]
+                _av[0, i, j] = summary.entry_count - summary.visitor_count
+                _vv[0, i, j] = summary.visitor_count
         self._loc_assignee_visits.append(_av)
         self._loc_visitor_visits.append(_vv)
         self._location_type_to_is = {k.__name__: v for k, v in state.location_type_infection_summary.items()}
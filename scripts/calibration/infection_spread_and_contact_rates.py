@@ -5,19 +5,34 @@ hyperparameters that are tuned in the script include spread rate and social dist
 rate
 """
 import dataclasses
+import functools
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import cast, Optional
+from itertools import repeat
+from pathlib import Path
+from typing import Any, cast, Dict, List, Optional, Tuple
 
 import GPyOpt
 import matplotlib.pyplot as plt
 import numpy as np
 from pandas import read_csv
-from tqdm import trange
 
 import pandemic_simulator as ps
+from pandemic_simulator.utils import trange
 
 SEED = 30
 MAX_EVAL_TRIALS_TO_VALID = 5
+NUM_INITIAL_POINTS = 5
+MAX_ITER = 20
+BATCH_SIZE = 4
+MODEL_MAX_ITERS = 100
+MODEL_UPDATE_INTERVAL = 3
+EARLY_STOP_TOL = 1e-3
+EARLY_STOP_PATIENCE = 5
+EPISODE_LENGTH = 60
+EVALUATIONS_PATH = Path(f'../results/calibration_sim_results_seed_{SEED}_days_{EPISODE_LENGTH}.npz')
+REAL_WORLD_DATA_PATH = Path('../results/calibration_real_world_data_sweden.npz')
 
 np.random.seed(SEED)
 
@@ -31,6 +46,12 @@ class CalibrationData:
         return bool(np.sum(self.deaths) > 0)
 
 
+# (spread rate, social distancing) rounded as in eval_params -> (simulator output, evaluation time). Only the
+# simulator output is cached (and persisted), scores are recomputed from it so that they always match the current
+# real-world data and scoring code.
+_evaluations: Dict[Tuple[float, float], Tuple[CalibrationData, float]] = {}
+
+
 def reset_patient_capacity(sim_config: ps.env.PandemicSimConfig) -> None:
     for lc in sim_config.location_configs:
         if issubclass(lc.location_type, ps.env.Hospital):
@@ -38,6 +59,25 @@ def reset_patient_capacity(sim_config: ps.env.PandemicSimConfig) -> None:
     sim_config.__post_init__()
 
 
+def infection_is_over(state: ps.env.PandemicSimState) -> bool:
+    """Check if there are no more exposed, infected or critical persons in the simulator. From then on there are no
+    new infections, hospital admissions or deaths.
+
+    :param state: current state of the simulator
+    :returns: True if the infection has died out
+    """
+    summary = state.global_infection_summary
+    if summary[ps.env.InfectionSummary.INFECTED] > 0 or summary[ps.env.InfectionSummary.CRITICAL] > 0:
+        return False
+
+    # exposed persons are summarized as NONE but will turn infected
+    for person_state in state.id_to_person_state.values():
+        infection_state = cast(Optional[ps.env.SEIRInfectionState], person_state.infection_state)
+        if infection_state is None or infection_state.label.value == 'exposed':
+            return False
+    return True
+
+
 def eval_params(params: np.ndarray,
                 max_episode_length: int,
                 trial_cnt: int = 0) -> CalibrationData:
@@ -55,8 +95,8 @@ def eval_params(params: np.ndarray,
     spread_rate = np.round(params[:, 0][0], decimals=3)
     social_distancing = np.round(params[:, 1][0], decimals=3)
 
-    deaths = []
-    hospitalizations = []
+    deaths = np.empty(max_episode_length, dtype=np.int64)
+    hosp_daily = np.empty_like(deaths)
     seed = SEED + trial_cnt
 
     if trial_cnt == 0:
@@ -74,82 +114,141 @@ def eval_params(params: np.ndarray,
     covid_regulation = dataclasses.replace(ps.sh.swedish_regulations[1], social_distancing=social_distancing)
     sim.impose_regulation(regulation=covid_regulation)
 
-    hospital_ids = sim.registry.location_ids_of_type(ps.env.Hospital)
-    hospital_weekly = 0
+    # the sim state and the location states are updated in place (they are only replaced on a sim reset), resolve
+    # them once. Note that the global infection summary is replaced on each infection update, it is read every day.
+    state = sim.state
+    hospital_states = [cast(ps.env.HospitalState, state.id_to_location_state[loc_id])
+                       for loc_id in sim.registry.location_ids_of_type(ps.env.Hospital)]
+    dead = ps.env.InfectionSummary.DEAD
 
     for i in trange(max_episode_length, desc='Simulating day'):
         sim.step_day()
-        state = sim.state
-        num_deaths = state.global_infection_summary[ps.env.InfectionSummary.DEAD]
-        deaths.append(num_deaths)
-        num_hospitalizations = sum([cast(ps.env.HospitalState, state.id_to_location_state[loc_id]).num_admitted_patients
-                                    for loc_id in hospital_ids])
-        hospital_weekly += num_hospitalizations
-        if i % 7 == 0:
-            hospitalizations.append(hospital_weekly)
-            hospital_weekly = 0
-    deaths_arr = np.asarray(deaths)
-    deaths_arr = deaths_arr[1:] - deaths_arr[:-1]
-
-    hosp_arr = np.asarray(hospitalizations)
-    hosp_arr = hosp_arr[1:] - hosp_arr[:-1]
+        deaths[i] = state.global_infection_summary[dead]
+        hosp_daily[i] = sum(hospital_state.num_admitted_patients for hospital_state in hospital_states)
+
+        # the remaining days cannot change the counts anymore, fill them in and skip simulating them
+        if infection_is_over(state):
+            deaths[i + 1:] = deaths[i]
+            hosp_daily[i + 1:] = hosp_daily[i]
+            break
+    deaths_arr = np.diff(deaths)
+
+    # bucket the daily values into complete weeks
+    num_weeks = max_episode_length // 7
+    hosp_arr = hosp_daily[:num_weeks * 7].reshape(num_weeks, 7).sum(axis=1)
+    hosp_arr = np.diff(hosp_arr)
 
     eval_result = CalibrationData(deaths=deaths_arr, hospitalizations=hosp_arr)
 
     return eval_result if eval_result.is_valid() else eval_params(params, max_episode_length, trial_cnt=trial_cnt + 1)
 
 
+def timed_eval_params(params: np.ndarray, max_episode_length: int) -> Tuple[CalibrationData, float]:
+    """Evaluate the params and measure the wall-clock time it took
+
+    :param params: spread rate and social distancing rate
+    :param max_episode_length: length of simulation run in days
+    :returns: a tuple of the CalibrationData instance and the evaluation time in seconds
+    """
+    start = time.perf_counter()
+    eval_result = eval_params(params, max_episode_length)
+    return eval_result, time.perf_counter() - start
+
+
+@functools.lru_cache(maxsize=1)
 def real_world_data() -> CalibrationData:
-    """Extract and treat real-world data from WHO
+    """Extract and treat real-world data from WHO. The data is downloaded once, stored at REAL_WORLD_DATA_PATH and
+    loaded from there (and cached) for the subsequent calls. Delete the file to download the latest data.
 
-    :returns: real-world death data
+    :returns: real-world death data (read-only arrays)
     """
-    # using Sweden's death and hospitalization data
-    deaths_url = 'https://raw.githubusercontent.com/owid/covid-19-data/master/public/data/ecdc/new_deaths.csv'
-    deaths_df = read_csv(deaths_url, header=0)
-    real_deaths = deaths_df['Sweden'].values
-    real_deaths = real_deaths[~np.isnan(real_deaths)]
+    if REAL_WORLD_DATA_PATH.exists():
+        with np.load(REAL_WORLD_DATA_PATH) as data:
+            real_deaths, real_hosp = data['deaths'], data['hospitalizations']
+    else:
+        # using Sweden's death and hospitalization data
+        deaths_url = 'https://raw.githubusercontent.com/owid/covid-19-data/master/public/data/ecdc/new_deaths.csv'
+        deaths_df = read_csv(deaths_url, header=0)
+        real_deaths = deaths_df['Sweden'].values
+        real_deaths = real_deaths[~np.isnan(real_deaths)]
+
+        hosp_url = 'https://raw.githubusercontent.com/owid/covid-19-data/master/scripts/grapher/' \
+                   'COVID-2019%20-%20Hospital%20&%20ICU.csv'
+        hosp_df = read_csv(hosp_url, header=0)
+        real_hosp = np.array(hosp_df[hosp_df['entity'] == 'Sweden']['Weekly new ICU admissions'])
+        real_hosp = np.round(real_hosp[~np.isnan(real_hosp)]).astype('int')
+
+        REAL_WORLD_DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(REAL_WORLD_DATA_PATH, deaths=real_deaths, hospitalizations=real_hosp)
+
+    # the result is shared across calls, guard it against in-place modifications
+    real_deaths.flags.writeable = False
+    real_hosp.flags.writeable = False
+    return CalibrationData(deaths=real_deaths, hospitalizations=real_hosp)
+
+
+def moving_average(data: np.ndarray, window: int = 5) -> np.ndarray:
+    """Compute a centered moving average with the semantics of
+    np.convolve(data, np.ones(window) / window, mode='same'), i.e. zero padded at both ends and of length
+    max(len(data), window). Inputs at least as long as the window use a prefix sum, which equals the convolution up
+    to floating point rounding.
+
+    :param data: data to average
+    :param window: size of the averaging window
+    :returns: averaged data
+    """
+    if len(data) < window:
+        out: np.ndarray = np.convolve(data, np.ones(window) / window, mode='same')
+        return out
 
-    hosp_url = 'https://raw.githubusercontent.com/owid/covid-19-data/master/scripts/grapher/' \
-               'COVID-2019%20-%20Hospital%20&%20ICU.csv'
-    hosp_df = read_csv(hosp_url, header=0)
-    real_hosp = np.array(hosp_df[hosp_df['entity'] == 'Sweden']['Weekly new ICU admissions'])
-    real_hosp = np.round(real_hosp[~np.isnan(real_hosp)]).astype('int')
-    return CalibrationData(deaths=real_deaths, hospitalizations=np.asarray(real_hosp))
+    # zero padding as in 'same' convolution plus a leading zero so that csum[k] is the sum of the first k values
+    csum = np.cumsum(np.pad(np.asarray(data, dtype=np.float64), (window // 2 + 1, window - 1 - window // 2)))
+    out = np.subtract(csum[window:], csum[:-window])
+    out /= window
+    return out
 
 
 def process_data(data: np.ndarray, data_len: Optional[int] = None, five_day_average: bool = False) -> np.ndarray:
-    # trim initial zeros
-    data = np.trim_zeros(data, 'f')[:data_len]
+    # trim initial zeros (as a view)
+    nonzero = np.flatnonzero(data)
+    data = data[nonzero[0] if len(nonzero) > 0 else len(data):][:data_len]
 
     # calculate sliding average
-    if five_day_average:
-        data = np.convolve(data, np.ones(5) / 5, mode='same')
+    out: np.ndarray = moving_average(data, 5) if five_day_average else data.astype(np.float64)
+
+    # normalize in place
+    out /= np.max(out)
 
-    # normalize
-    data = data / np.max(data)
+    return out
 
-    return data
+
+@functools.lru_cache(maxsize=None)
+def real_data_until_peak(data_len: int) -> np.ndarray:
+    """Process the real-world hospitalization data to the given length and cut it after its peak. The result only
+    depends on the length of the (trimmed) simulator data, so it is computed once per length.
+
+    :param data_len: length of the processed simulator data
+    :returns: processed real-world data up to and including its peak (read-only)
+    """
+    real_data = process_data(real_world_data().hospitalizations, data_len=data_len)
+    real_peak = np.argmax(real_data).item()
+    real_data = real_data[:real_peak + 1]
+    real_data.flags.writeable = False
+    return real_data
 
 
-def obj_func(params: np.ndarray) -> float:
-    """Objective function calculates fitness score for a given parameter set
+def score(sim_result: CalibrationData) -> float:
+    """Calculate the fitness score of a simulator run against the real-world data
 
-    :param params: spread rate and social distancing rate to be evaluated
+    :param sim_result: simulator output for a parameter set
     :returns: fitness score of parameter set
     """
     # get sim data
-    sim_result: CalibrationData = eval_params(params, 60)
     sim_data = process_data(sim_result.hospitalizations)
 
-    # get real data
-    real_result: CalibrationData = real_world_data()
-    real_data = process_data(real_result.hospitalizations, data_len=len(sim_data))
-
-    # compare only until the rise of real_peak
-    real_peak = np.argmax(real_data).item()
-    real_data = real_data[:real_peak + 1]
-    sim_data = sim_data[:real_peak + 1]
+    # get real data, compare only until the rise of real_peak
+    real_data = real_data_until_peak(len(sim_data))
+    sim_data = sim_data[:len(real_data)]
 
     # get score
     score = np.linalg.norm(real_data - sim_data)
@@ -158,6 +257,104 @@ def obj_func(params: np.ndarray) -> float:
     return float(score)
 
 
+def evaluation_key(params: np.ndarray) -> Tuple[float, float]:
+    """Return the key of a parameter set in the evaluations cache
+
+    :param params: spread rate and social distancing rate, shape (2,)
+    :returns: the parameters rounded to the precision used by eval_params
+    """
+    spread_rate, social_distancing = np.round(params, decimals=3)
+    return float(spread_rate), float(social_distancing)
+
+
+def save_evaluations(path: Path) -> None:
+    """Persist the simulator outputs and evaluation times of all evaluations done so far
+
+    :param path: path of the npz file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    sim_results = [sim_result for sim_result, _ in _evaluations.values()]
+    np.savez(path,
+             X=np.asarray(list(_evaluations.keys())),
+             deaths=np.stack([sim_result.deaths for sim_result in sim_results]),
+             hospitalizations=np.stack([sim_result.hospitalizations for sim_result in sim_results]),
+             costs=np.asarray([cost for _, cost in _evaluations.values()]))
+
+
+def load_evaluations(path: Path) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Load the simulator outputs persisted by a previous run into the evaluations cache and score them
+
+    :param path: path of the npz file
+    :returns: a tuple of the evaluated parameter sets, their scores and evaluation times or None if nothing was
+        persisted yet
+    """
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        X, deaths, hosp, costs = data['X'], data['deaths'], data['hospitalizations'], data['costs']
+    for x, d, h, cost in zip(X, deaths, hosp, costs):
+        _evaluations[evaluation_key(x)] = (CalibrationData(deaths=d, hospitalizations=h), float(cost))
+    Y, _ = evaluations_of(X)
+    return X, Y, costs
+
+
+def evaluations_of(params: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Score the cached simulator outputs of the given parameter sets
+
+    :param params: evaluated spread rates and social distancing rates, shape (N, 2)
+    :returns: a tuple of the fitness scores of the parameter sets, shape (N, 1), and their evaluation times in
+        seconds, shape (N,)
+    """
+    evaluations = [_evaluations[evaluation_key(p)] for p in params]
+    scores = np.asarray([[score(sim_result)] for sim_result, _ in evaluations])
+    costs = np.asarray([cost for _, cost in evaluations])
+    return scores, costs
+
+
+def obj_func(params: np.ndarray, executor: ProcessPoolExecutor) -> Tuple[np.ndarray, np.ndarray]:
+    """Objective function calculates fitness scores for a batch of parameter sets. The parameter sets are
+    simulated in parallel by the given executor, the results are scored in the main process. Parameter sets that
+    were simulated before are not simulated again.
+
+    :param params: spread rates and social distancing rates to be evaluated, shape (N, 2)
+    :param executor: pool of worker processes that is shared across calls
+    :returns: a tuple of the fitness scores of the parameter sets, shape (N, 1), and their evaluation times in
+        seconds, shape (N,)
+    """
+    params_to_eval: Dict[Tuple[float, float], np.ndarray] = {}
+    for p in params:
+        key = evaluation_key(p)
+        if key not in _evaluations:
+            params_to_eval.setdefault(key, p)
+
+    if len(params_to_eval) > 0:
+        timed_results = executor.map(timed_eval_params, [np.atleast_2d(p) for p in params_to_eval.values()],
+                                     repeat(EPISODE_LENGTH))
+        for key, timed_result in zip(params_to_eval, timed_results):
+            _evaluations[key] = timed_result
+
+    return evaluations_of(params)
+
+
+def make_batch_optimizer(domain: List[Dict[str, Any]], X: np.ndarray, Y: np.ndarray, model: GPyOpt.models.GPModel,
+                         cost_model: GPyOpt.core.task.cost.CostModel) -> GPyOpt.methods.BayesianOptimization:
+    """Build an optimizer over the evaluations so far that is only used to ask for the next batch of parameter sets.
+    The batch is selected by Thompson sampling, every point starts from a sample of the surrogate and then follows the
+    cost-aware acquisition. GPyOpt's local penalization evaluator rejects user-defined models and fails with
+    scipy>=1.5.
+
+    :param domain: GPyOpt domain of the parameters
+    :param X: evaluated parameter sets, shape (N, 2)
+    :param Y: fitness scores of the evaluated parameter sets, shape (N, 1)
+    :param model: surrogate model, reused across optimizers so that its kernel hyperparameters carry over
+    :param cost_model: model of the evaluation times that weighs the acquisition
+    :returns: optimizer to call suggest_next_locations on
+    """
+    return GPyOpt.methods.BayesianOptimization(f=None, domain=domain, X=X, Y=Y, model=model,
+                                               cost_withGradients=cost_model.cost_withGradients,
+                                               evaluator_type='thompson_sampling', batch_size=BATCH_SIZE)
+
+
 def make_plots(params: np.ndarray) -> None:
     """Plot final parameter set output against real world data
 
@@ -184,14 +381,59 @@ def make_plots(params: np.ndarray) -> None:
 if __name__ == '__main__':
     bounds2d = [{'name': 'spread rate', 'type': 'continuous', 'domain': (0.005, 0.03)},
                 {'name': 'contact rate', 'type': 'continuous', 'domain': (0., 0.4)}]
-    myBopt_2d = GPyOpt.methods.BayesianOptimization(obj_func, domain=bounds2d)
-    myBopt_2d.run_optimization()
+    # the cost model fits a GP to the log evaluation times, the acquisition is divided by its prediction so that
+    # cheaper regions of the search space are favored (expected improvement per second)
+    cost_model = GPyOpt.core.task.cost.CostModel('evaluation_time')
+
+    # a single pool of worker processes simulates all batches, it is shut down once the optimization is done
+    with ProcessPoolExecutor(max_workers=max(NUM_INITIAL_POINTS, BATCH_SIZE)) as executor:
+        # warm-start from the evaluations of previous runs or evaluate a random initial design, then ask the optimizer
+        # for batches of points that are simulated in parallel
+        prior_evaluations = load_evaluations(EVALUATIONS_PATH)
+        if prior_evaluations is not None:
+            X, Y, costs = prior_evaluations
+        else:
+            X = GPyOpt.experiment_design.initial_design('random', GPyOpt.Design_space(bounds2d), NUM_INITIAL_POINTS)
+            Y, costs = obj_func(X, executor)
+            save_evaluations(EVALUATIONS_PATH)
+        cost_model.update_cost_model(X, costs)
+
+        # the surrogate (Matern 5/2 GP) is shared across iterations so that its kernel hyperparameters carry over, they
+        # are only re-optimized every MODEL_UPDATE_INTERVAL iterations
+        model = GPyOpt.models.GPModel(optimize_restarts=1, max_iters=MODEL_MAX_ITERS, verbose=False)
+        best = np.min(Y)
+        num_stalled_iters = 0
+        for it in range(MAX_ITER):
+            model.max_iters = MODEL_MAX_ITERS if it % MODEL_UPDATE_INTERVAL == 0 else 0
+            myBopt_2d = make_batch_optimizer(bounds2d, X, Y, model, cost_model)
+            X_next = myBopt_2d.suggest_next_locations()
+            Y_next, costs = obj_func(X_next, executor)
+            cost_model.update_cost_model(X_next, costs)
+            save_evaluations(EVALUATIONS_PATH)
+            X = np.vstack((X, X_next))
+            Y = np.vstack((Y, Y_next))
+
+            # stop once the best score has not improved by more than EARLY_STOP_TOL for EARLY_STOP_PATIENCE iterations
+            num_stalled_iters = num_stalled_iters + 1 if best - np.min(Y) < EARLY_STOP_TOL else 0
+            best = min(best, np.min(Y))
+            if num_stalled_iters >= EARLY_STOP_PATIENCE:
+                print(f'Stopping early after {it + 1} iterations, no improvement in the last {num_stalled_iters}.')
+                break
+
+    x_opt = X[np.argmin(Y)]
+    fx_opt = np.min(Y)
 
     print("=" * 20)
-    print("Value of (spread rate, contact rate) that minimises the objective:" + str(myBopt_2d.x_opt))
-    print("Minimum value of the objective: " + str(myBopt_2d.fx_opt))
+    print("Value of (spread rate, contact rate) that minimises the objective:" + str(x_opt))
+    print("Minimum value of the objective: " + str(fx_opt))
     print("=" * 20)
 
-    make_plots(np.array([[myBopt_2d.x_opt[0], myBopt_2d.x_opt[1]]], dtype=np.float64))
+    make_plots(np.array([[x_opt[0], x_opt[1]]], dtype=np.float64))
 
+    # plot the posterior over all evaluations, including the last batch. plot_acquisition keeps an already fitted
+    # model, so refit the surrogate (with optimized hyperparameters) first and keep them fixed while plotting.
+    model.max_iters = MODEL_MAX_ITERS
+    myBopt_2d = make_batch_optimizer(bounds2d, X, Y, model, cost_model)
+    myBopt_2d.suggest_next_locations()
+    model.max_iters = 0
     myBopt_2d.plot_acquisition()
@@ -1,11 +1,12 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
+from multiprocessing import Pool
 from typing import List
 
 from matplotlib import pyplot as plt
 from numpy import max
-from tqdm import trange
 
 import pandemic_simulator as ps
+from pandemic_simulator.utils import trange
 
 
 def run(days: int, stage: int, days_per_interval: int) -> List[int]:
@@ -38,9 +39,10 @@ if __name__ == '__main__':
     title = "2-Week Interval"
     days_per_interval = 14
 
-    stage_results = []
-    for stage in range(0, 5):
-        stage_results.append(run(days=100, stage=stage, days_per_interval=days_per_interval))
+    # each stage is an independent simulation (with the same seed), run them in parallel
+    num_stages = 5
+    with Pool(num_stages) as pool:
+        stage_results = pool.starmap(run, [(100, stage, days_per_interval) for stage in range(num_stages)])
 
     plt.figure(figsize=(12, 8))
 
@@ -1,4 +1,5 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
+import os
 
 from matplotlib import pyplot as plt
 
@@ -32,7 +33,8 @@ if __name__ == '__main__':
         num_seeds=30,
         strategies=strategies,
         max_episode_length=120,
-        enable_warm_up=True
+        enable_warm_up=True,
+        num_workers=os.cpu_count() or 1
     )
 
     experiment_name = 'handset_strategies'
@@ -1,4 +1,5 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
+import os
 
 from matplotlib import pyplot as plt
 
@@ -7,25 +8,28 @@ import pandemic_simulator as ps
 
 def eval_government_strategies(experiment_name: str, opts: ps.sh.EvaluationOpts) -> None:
     data_saver = ps.data.H5DataSaver(experiment_name, path=opts.data_saver_path)
-    print('Running Swedish strategy')
-    ps.sh.experiment_main(sim_config=opts.default_sim_config,
-                          sim_opts=ps.env.PandemicSimOpts(),
-                          data_saver=data_saver,
-                          pandemic_regulations=ps.sh.swedish_regulations,
-                          stages_to_execute=swedish_strategy,
-                          num_random_seeds=opts.num_seeds,
-                          max_episode_length=opts.max_episode_length,
-                          exp_id=0)
-
-    print('Running Italian strategy')
-    ps.sh.experiment_main(sim_config=opts.default_sim_config,
-                          sim_opts=ps.env.PandemicSimOpts(),
-                          data_saver=data_saver,
-                          pandemic_regulations=ps.sh.italian_regulations,
-                          stages_to_execute=italian_strategy,
-                          num_random_seeds=opts.num_seeds,
-                          max_episode_length=opts.max_episode_length,
-                          exp_id=1)
+    with ps.sh.worker_pool(opts.num_workers) as pool:
+        print('Running Swedish strategy')
+        ps.sh.experiment_main(sim_config=opts.default_sim_config,
+                              sim_opts=ps.env.PandemicSimOpts(),
+                              data_saver=data_saver,
+                              pandemic_regulations=ps.sh.swedish_regulations,
+                              stages_to_execute=swedish_strategy,
+                              num_random_seeds=opts.num_seeds,
+                              max_episode_length=opts.max_episode_length,
+                              pool=pool,
+                              exp_id=0)
+
+        print('Running Italian strategy')
+        ps.sh.experiment_main(sim_config=opts.default_sim_config,
+                              sim_opts=ps.env.PandemicSimOpts(),
+                              data_saver=data_saver,
+                              pandemic_regulations=ps.sh.italian_regulations,
+                              stages_to_execute=italian_strategy,
+                              num_random_seeds=opts.num_seeds,
+                              max_episode_length=opts.max_episode_length,
+                              pool=pool,
+                              exp_id=1)
 
 
 if __name__ == '__main__':
@@ -42,7 +46,8 @@ if __name__ == '__main__':
     opts = ps.sh.EvaluationOpts(
         num_seeds=30,
         max_episode_length=180,
-        enable_warm_up=False
+        enable_warm_up=False,
+        num_workers=os.cpu_count() or 1
     )
 
     exp_name = 'swedish_italian_strategies'
@@ -1,8 +1,7 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 
-from tqdm import trange
-
 import pandemic_simulator as ps
+from pandemic_simulator.utils import trange
 
 
 def simple_worker_loop_with_routines() -> None:
@@ -1,10 +1,9 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 from typing import Sequence, Type
 
-from tqdm import trange
-
 import pandemic_simulator as ps
 from pandemic_simulator.environment import Person, Location
+from pandemic_simulator.utils import trange
 
 
 def using_person_routine_assignment() -> None:
@@ -1,7 +1,5 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 
-from tqdm import trange
-
 import pandemic_simulator as ps
 
 
@@ -48,21 +46,15 @@ def impose_regulations() -> None:
     )
 
     # Iterate with no restrictions
-    for _ in trange(3, desc='Simulating day (no restrictions)'):
-        sim.step_day()
-        viz.record_state(sim.state)
+    sim.step_days(3, on_day=viz.record_state, desc='Simulating day (no restrictions)')
 
     # Iterate after imposing stage 1 restrictions
     sim.impose_regulation(regulation_1)
-    for _ in trange(3, desc='Simulating day (stage 1)'):
-        sim.step_day()
-        viz.record_state(sim.state)
+    sim.step_days(3, on_day=viz.record_state, desc='Simulating day (stage 1)')
 
     # Iterate after imposing stage 2 restrictions
     sim.impose_regulation(regulation_2)
-    for _ in trange(3, desc='Simulating day (stage 2)'):
-        sim.step_day()
-        viz.record(sim.state)
+    sim.step_days(3, on_day=viz.record_state, desc='Simulating day (stage 2)')
 
     # display plots to show grocery store (visitor visits)
     viz.plot([ps.viz.PlotType.global_infection_summary, ps.viz.PlotType.stages])
@@ -1,6 +1,4 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
-from tqdm import trange
-
 import pandemic_simulator as ps
 
 
@@ -25,9 +23,7 @@ def run_pandemic_sim() -> None:
     sim.impose_regulation(regulation=ps.sh.austin_regulations[0])  # stage 0
 
     # run regulation steps in the simulator
-    for _ in trange(100, desc='Simulating day'):
-        sim.step_day()
-        viz.record(sim.state)
+    sim.step_days(100, on_day=viz.record, desc='Simulating day')
 
     # generate plots
     viz.plot()
@@ -15,12 +15,11 @@ setup(
     package_data={'': ['VERSION'],
                   'pandemic_simulator': ['py.typed']},
     install_requires=[
-        'dataclasses',
         'gym>=0.15.4',
         'istype>=0.2.0',
         'matplotlib',
         'networkx',  # for graph analysis
-        'numpy==1.19.5',    # 1.20 numpy requires mypy fixes #TODO
+        'numpy>=1.21,<2.0',
         'scipy',
         'probabilistic-automata>=0.4.0',  # for probabilistic DFA
         'pyrsistent>=0.15.5',  # for frozen classes
@@ -28,7 +27,6 @@ setup(
         'PyYAML>=5.3.1',
         'typing-inspect==0.5.0',  # to handle issubclass changes in python 3.7,
 
-        'orderedset>=2.0.3',
         'cachetools>=4.1.0',
         'h5py>=2.10.0',
         'tqdm>=4.48.0',
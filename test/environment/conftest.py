@@ -0,0 +1,20 @@
+# Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
+from typing import Tuple
+
+import pytest
+
+import pandemic_simulator as ps
+
+
+@pytest.fixture(scope='session')
+def small_town_registry() -> Tuple[ps.env.PandemicSimConfig, ps.env.Registry]:
+    """A small town population built once and shared by all the tests in the session."""
+    ps.init_globals(seed=0)
+    config = ps.sh.small_town_config
+
+    ps.env.make_locations(config)
+    ps.env.make_population(config)
+
+    registry = ps.env.globals.registry
+    assert registry
+    return config, registry
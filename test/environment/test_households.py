@@ -1,60 +1,53 @@
+from typing import Tuple
+
 import numpy as np
 
 import pandemic_simulator as ps
 
 
-def test_family_households() -> None:
-    ps.init_globals()
-    config = ps.sh.small_town_config
-    cr = ps.env.globals.registry
-    assert cr
+# minors are aged <= 18, adults 19-65 and retirees > 65
+AGE_BINS = np.array([19, 66], dtype=np.int8)
+
+
+def _ages_in_location(registry: ps.env.Registry, location_id: ps.env.LocationID) -> np.ndarray:
+    """Return the ages of the persons in the given location as an int8 array."""
+    persons = registry.get_persons_in_location(location_id)
+    return np.fromiter((person_id.age for person_id in persons), dtype=np.int8, count=len(persons))
 
-    ps.env.make_locations(config)
-    ps.env.make_population(config)
 
-    retiree_homes_list = []
-    minor_homes_list = []
-    adult_homes_list = []
+def _classify_ages(ages: np.ndarray) -> np.ndarray:
+    """Return the [minors, adults, retirees] counts for the given ages."""
+    return np.bincount(np.searchsorted(AGE_BINS, ages, side='right'), minlength=3)
+
+
+def test_family_households(small_town_registry: Tuple[ps.env.PandemicSimConfig, ps.env.Registry]) -> None:
+    config, cr = small_town_registry
 
     homes = cr.location_ids_of_type(ps.env.Home)
 
-    tot_persons = 0
-    for home in homes:
-        household = cr.get_persons_in_location(home)
-
-        adults = 0
-        minors = 0
-        retirees = 0
-        for member in household:
-            if member.age <= 18:
-                minors += 1
-            elif 18 < member.age <= 65:
-                adults += 1
-            else:
-                retirees += 1
-        if minors > 0:
-            minor_homes_list.append([minors, adults, retirees])
-        elif adults > 0:
-            adult_homes_list.append([minors, adults, retirees])
-        elif retirees > 0:
-            retiree_homes_list.append([minors, adults, retirees])
-        tot_persons += len(household)
-
-    assert len(minor_homes_list)
-    assert len(adult_homes_list)
-    assert len(retiree_homes_list)
-    assert tot_persons == config.num_persons
-
-    minor_homes = np.asarray(minor_homes_list)
-    adult_homes = np.asarray(adult_homes_list)
-    retiree_homes = np.asarray(retiree_homes_list)
+    # [minors, adults, retirees] counts of each home
+    household_counts = np.empty((len(homes), 3), dtype=np.int32)
+    for i, home in enumerate(homes):
+        household_counts[i] = _classify_ages(_ages_in_location(cr, home))
+
+    has_minors = household_counts[:, 0] > 0
+    has_adults = household_counts[:, 1] > 0
+    has_retirees = household_counts[:, 2] > 0
+    minor_homes = household_counts[has_minors]
+    adult_homes = household_counts[~has_minors & has_adults]
+    retiree_homes = household_counts[~has_minors & ~has_adults & has_retirees]
+
+    assert len(minor_homes)
+    assert len(adult_homes)
+    assert len(retiree_homes)
+    assert household_counts.sum() == config.num_persons
 
     # there should be non-zero homes with 1, 2, and 3 children
     for i in range(1, 4):
         assert len(minor_homes[minor_homes[:, 0] == i]) > 0
 
     # each minor home must contain an adult
-    assert all(minor_homes[:, 1] > 0)
+    assert (minor_homes[:, 1] > 0).all()
 
     # minor homes in general must also have retirees for small town config
     assert np.sum(minor_homes, axis=0)[2] > 0
@@ -75,63 +68,36 @@ def test_family_households() -> None:
     assert np.sum(retiree_homes, axis=0)[0] == 0
 
 
-def test_retiree_households() -> None:
-    ps.init_globals()
-    config = ps.sh.small_town_config
+def test_retiree_households(small_town_registry: Tuple[ps.env.PandemicSimConfig, ps.env.Registry]) -> None:
+    _, cr = small_town_registry
 
-    ps.env.make_locations(config)
-    ps.env.make_population(config)
+    home_ages = [_ages_in_location(cr, home) for home in cr.location_ids_of_type(ps.env.Home)]
+    home_sizes = np.array([len(ages) for ages in home_ages])
+    home_sizes = home_sizes[home_sizes > 0]  # reduceat does not support empty segments
+    home_offsets = np.cumsum(home_sizes) - home_sizes
 
-    cr = ps.env.globals.registry
-    assert cr
+    # number of retirees in each home
+    home_retirees = np.add.reduceat(np.concatenate(home_ages) > 65, home_offsets, dtype=np.int32)
+    is_nursing_home = home_retirees == home_sizes
 
-    home_ids = cr.location_ids_of_type(ps.env.Home)
-    retirees_in_nursing_home = 0
-    all_retirees = 0
-    for home in home_ids:
-        household = cr.get_persons_in_location(home)
-        is_nursing_home = True
-        for member in household:
-            if member.age <= 65:
-                is_nursing_home = False
-            else:
-                all_retirees += 1
-        if is_nursing_home:
-            retirees_in_nursing_home += len(household)
+    retirees_in_nursing_home = home_sizes[is_nursing_home].sum()
+    all_retirees = home_retirees.sum()
 
     assert (retirees_in_nursing_home / all_retirees) >= 0.065
 
 
-def test_single_parent_households() -> None:
-    ps.init_globals()
-    config = ps.sh.small_town_config
-
-    ps.env.make_locations(config)
-    ps.env.make_population(config)
-
-    cr = ps.env.globals.registry
-    assert cr
-
-    minor_homes_list = []
+def test_single_parent_households(small_town_registry: Tuple[ps.env.PandemicSimConfig, ps.env.Registry]) -> None:
+    _, cr = small_town_registry
 
     homes = cr.location_ids_of_type(ps.env.Home)
 
-    for home in homes:
-        household = cr.get_persons_in_location(home)
-        minors = 0
-        adults = 0
-        retirees = 0
-        for member in household:
-            if member.age <= 18:
-                minors += 1
-            elif 18 < member.age <= 65:
-                adults += 1
-            else:
-                retirees += 1
-        if minors > 0:
-            minor_homes_list.append([minors, adults, retirees])
-
-    minor_homes = np.asarray(minor_homes_list)
+    # [minors, adults, retirees] counts of each home
+    household_counts = np.empty((len(homes), 3), dtype=np.int32)
+    for i, home in enumerate(homes):
+        ages = _ages_in_location(cr, home)
+        household_counts[i] = _classify_ages(ages)
+
+    minor_homes = household_counts[household_counts[:, 0] > 0]
     nm = minor_homes[:, 1] + minor_homes[:, 2]
-    single_parent_homes = sum(nm == 1)
+    single_parent_homes = (nm == 1).sum()
     assert (single_parent_homes / len(minor_homes)) > 0.22
@@ -2,9 +2,9 @@
 
 import numpy as np
 import pytest
-from orderedset import OrderedSet
 
 from pandemic_simulator.environment import MaxSlotContactTracer, PersonID
+from pandemic_simulator.utils import OrderedSet
 
 
 @pytest.fixture
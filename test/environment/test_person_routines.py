@@ -1,15 +1,20 @@
 # Confidential, Copyright 2021, Sony Corporation of America, All rights reserved.
-from typing import Optional
+from typing import Optional, Tuple
+
+import pytest
 
 import pandemic_simulator as ps
 from pandemic_simulator.environment import SimTime, PersonState
 
 
-def test_person_routine_with_status_sim_time_trigger() -> None:
+@pytest.fixture(scope='module')
+def home_and_store() -> Tuple[ps.env.Home, ps.env.GroceryStore]:
     ps.init_globals()
+    return ps.env.Home(), ps.env.GroceryStore()
+
 
-    home = ps.env.Home()
-    store = ps.env.GroceryStore()
+def test_person_routine_with_status_sim_time_trigger(home_and_store: Tuple[ps.env.Home, ps.env.GroceryStore]) -> None:
+    home, store = home_and_store
 
     r = ps.env.PersonRoutine(start_loc=home.id,
                              end_loc=store.id,
@@ -55,11 +60,8 @@ class StateRoutineTrigger(ps.env.RoutineTrigger):
         return person_state.risk == ps.env.Risk.HIGH
 
 
-def test_person_routine_with_status_state_trigger() -> None:
-    ps.init_globals()
-
-    home = ps.env.Home()
-    store = ps.env.GroceryStore()
+def test_person_routine_with_status_state_trigger(home_and_store: Tuple[ps.env.Home, ps.env.GroceryStore]) -> None:
+    home, store = home_and_store
 
     r = ps.env.PersonRoutine(start_loc=home.id,
                              end_loc=store.id,
@@ -67,32 +69,36 @@ def test_person_routine_with_status_state_trigger() -> None:
                              reset_when_done_trigger=ps.env.SimTimeRoutineTrigger(day=1))
     rws = ps.env.PersonRoutineWithStatus(r)
 
+    # the routine only reads the person states, so they are shared across the syncs
+    low_risk_state = PersonState(home.id, risk=ps.env.Risk.LOW)
+    high_risk_state = PersonState(home.id, risk=ps.env.Risk.HIGH)
+
     # check flags for non-trigger state
-    rws.sync(ps.env.SimTime(hour=5), person_state=PersonState(home.id, risk=ps.env.Risk.LOW))
+    rws.sync(ps.env.SimTime(hour=5), person_state=low_risk_state)
     assert not rws.started
     assert not rws.due
     assert not rws.done
 
     # due should be true at state trigger
-    rws.sync(ps.env.SimTime(hour=5), person_state=PersonState(home.id, risk=ps.env.Risk.HIGH))
+    rws.sync(ps.env.SimTime(hour=5), person_state=high_risk_state)
     assert rws.due
 
     # due should remain true even after trigger
-    rws.sync(ps.env.SimTime(hour=11), person_state=PersonState(home.id, risk=ps.env.Risk.LOW))
+    rws.sync(ps.env.SimTime(hour=11), person_state=low_risk_state)
     assert rws.due
 
     # due should switch to false when routine has started
     rws.started = True
-    rws.sync(ps.env.SimTime(hour=12), person_state=PersonState(home.id, risk=ps.env.Risk.HIGH))
+    rws.sync(ps.env.SimTime(hour=12), person_state=high_risk_state)
     assert not rws.due
 
     # same when done is True
     rws.done = True
-    rws.sync(ps.env.SimTime(hour=13), person_state=PersonState(home.id, risk=ps.env.Risk.HIGH))
+    rws.sync(ps.env.SimTime(hour=13), person_state=high_risk_state)
     assert not rws.due
 
     # flags reset at reset trigger and due is again set (because of state trigger)
-    rws.sync(ps.env.SimTime(day=1, hour=0), person_state=PersonState(home.id, risk=ps.env.Risk.HIGH))
+    rws.sync(ps.env.SimTime(day=1, hour=0), person_state=high_risk_state)
     assert not rws.started
     assert rws.due
     assert not rws.done
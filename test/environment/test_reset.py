@@ -1,18 +1,36 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 import copy
+import dataclasses
+from typing import Any, List, Tuple
+
+import pytest
 
 import pandemic_simulator as ps
 
 
-def test_location_and_person_reset() -> None:
-    ps.init_globals()
+@pytest.fixture(scope='module')
+def tiny_town_world() -> Tuple[List[ps.env.Location], List[ps.env.Person]]:
+    """Tiny town locations and persons, built for the reset test."""
+    ps.init_globals(seed=0)
     config = ps.sh.tiny_town_config
+    return ps.env.make_locations(config), ps.env.make_population(config)
+
+
+def _snapshot(state: Any) -> Any:
+    """Shallow copy a state dataclass, also copying its container fields so that later mutations do not leak in."""
+    snapshot = copy.copy(state)
+    for field in dataclasses.fields(state):
+        value = getattr(state, field.name)
+        if isinstance(value, (list, set, dict, ps.utils.OrderedSet)):
+            setattr(snapshot, field.name, type(value)(value))
+    return snapshot
+
 
-    locations = ps.env.make_locations(config)
-    persons = ps.env.make_population(config)
+def test_location_and_person_reset(tiny_town_world: Tuple[List[ps.env.Location], List[ps.env.Person]]) -> None:
+    locations, persons = tiny_town_world
 
-    loc_states = [copy.deepcopy(loc.state) for loc in locations]
-    per_states = [copy.deepcopy(per.state) for per in persons]
+    loc_states = [_snapshot(loc.state) for loc in locations]
+    per_states = [_snapshot(per.state) for per in persons]
 
     for loc in locations:
         loc.reset()
@@ -20,11 +38,25 @@ def test_location_and_person_reset() -> None:
     for per in persons:
         per.reset()
 
-    new_loc_states = [copy.deepcopy(loc.state) for loc in locations]
-    new_per_states = [copy.deepcopy(per.state) for per in persons]
+    new_loc_states = [_snapshot(loc.state) for loc in locations]
+    new_per_states = [_snapshot(per.state) for per in persons]
+
+    assert loc_states == new_loc_states
+    assert per_states == new_per_states
+
+
+def test_gym_env_seed_and_reset() -> None:
+    ps.init_globals(seed=0)
+    # 5 steps of 5 hours span two daily infection updates and contact tracer time slots
+    sim_opts = ps.env.PandemicSimOpts(use_contact_tracer=True, sim_steps_per_regulation=5)
+    env = ps.env.PandemicGymEnv.from_config(ps.sh.tiny_town_config, pandemic_regulations=ps.sh.austin_regulations,
+                                            sim_opts=sim_opts)
 
-    for st1, st2 in zip(loc_states, new_loc_states):
-        assert st1 == st2
+    episodes = []
+    for _ in range(2):
+        env.seed(1)
+        env.reset()
+        episodes.append([env.step(action=0)[0].global_infection_summary for _ in range(5)])
 
-    for st1, st2 in zip(per_states, new_per_states):
-        assert st1 == st2
+    for gis1, gis2 in zip(*episodes):
+        assert (gis1 == gis2).all()
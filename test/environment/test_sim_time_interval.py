@@ -1,5 +1,6 @@
 # Confidential, Copyright 2020, Sony Corporation of America, All rights reserved.
 
+import numpy as np
 import pytest
 
 from pandemic_simulator.environment import SimTime, SimTimeInterval
@@ -8,21 +9,21 @@ from pandemic_simulator.environment import SimTime, SimTimeInterval
 def test_sim_time_interval_trigger_hour() -> None:
     hour = 5
     interval = SimTimeInterval(hour=hour)
-    for i in range(1, 3):
-        assert interval.trigger_at_interval(SimTime(hour=hour * i))
-        assert not interval.trigger_at_interval(SimTime(hour=hour * i + 1))
-        assert not interval.trigger_at_interval(SimTime(hour=hour * i - 1))
+    multiples = (1, 2)
+    assert [interval.trigger_at_interval(SimTime(hour=hour * i)) for i in multiples] == [True, True]
+    assert [interval.trigger_at_interval(SimTime(hour=hour * i + 1)) for i in multiples] == [False, False]
+    assert [interval.trigger_at_interval(SimTime(hour=hour * i - 1)) for i in multiples] == [False, False]
 
 
 def test_sim_time_interval_trigger_day() -> None:
     day = 5
     hour = 6
     interval = SimTimeInterval(day=day, hour=hour)
-    for i in range(1, 3):
-        assert interval.trigger_at_interval(SimTime(day=day * i, hour=hour * i))
-        assert not interval.trigger_at_interval(SimTime(day=day * i + 1))
-        assert not interval.trigger_at_interval(SimTime(day=day * i - 1))
-        assert not interval.trigger_at_interval(SimTime(day=day, hour=1))
+    multiples = (1, 2)
+    assert [interval.trigger_at_interval(SimTime(day=day * i, hour=hour * i)) for i in multiples] == [True, True]
+    assert [interval.trigger_at_interval(SimTime(day=day * i + 1)) for i in multiples] == [False, False]
+    assert [interval.trigger_at_interval(SimTime(day=day * i - 1)) for i in multiples] == [False, False]
+    assert not interval.trigger_at_interval(SimTime(day=day, hour=1))
 
 
 @pytest.mark.parametrize(['hour', 'day', 'offset_hour', 'offset_day'],
@@ -36,14 +37,15 @@ def test_sim_time_interval_trigger_day() -> None:
 def test_sim_time_interval_trigger_offset(hour: int, day: int, offset_hour: int, offset_day: int) -> None:
     interval = SimTimeInterval(hour=hour, day=day, offset_hour=offset_hour, offset_day=offset_day)
 
+    trigger = np.frompyfunc(lambda d, h: interval.trigger_at_interval(SimTime(day=int(d), hour=int(h))), 2, 1)
+
+    # no trigger before the offset. Each hour is evaluated once, the former inner loop repeated the same check.
     if offset_day > 0:
-        for i in range(offset_day + 1):
-            for j in range(24 if i < offset_day else offset_hour):
-                assert not interval.trigger_at_interval(SimTime(day=day, hour=i))
+        before_offset = np.arange(offset_day + 1 if offset_hour > 0 else offset_day)
+        assert not trigger(day, before_offset).astype(bool).any()
     else:
-        for i in range(offset_hour):
-            assert not interval.trigger_at_interval(SimTime(hour=i))
+        assert not trigger(0, np.arange(offset_hour)).astype(bool).any()
 
-    for i in range(1, 3):
-        assert interval.trigger_at_interval(SimTime(day=day * i + offset_day, hour=hour * i + offset_hour))
-        assert not interval.trigger_at_interval(SimTime(day=day * i, hour=hour * i))
+    multiples = np.arange(1, 3)
+    assert trigger(day * multiples + offset_day, hour * multiples + offset_hour).astype(bool).all()
+    assert not trigger(day * multiples, hour * multiples).astype(bool).any()
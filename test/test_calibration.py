@@ -0,0 +1,42 @@
+# Confidential, Copyright 2021, Sony Corporation of America, All rights reserved.
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+GPyOpt = pytest.importorskip('GPyOpt')
+
+_SCRIPT_PATH = Path(__file__).parents[1] / 'scripts' / 'calibration' / 'infection_spread_and_contact_rates.py'
+
+
+def _load_calibration_script() -> ModuleType:
+    spec = importlib.util.spec_from_file_location('infection_spread_and_contact_rates', _SCRIPT_PATH)
+    assert spec and spec.loader
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_suggest_next_batch() -> None:
+    calibration = _load_calibration_script()
+    domain = [{'name': 'spread rate', 'type': 'continuous', 'domain': (0.005, 0.03)},
+              {'name': 'contact rate', 'type': 'continuous', 'domain': (0., 0.4)}]
+    np.random.seed(0)
+    X = GPyOpt.experiment_design.initial_design('random', GPyOpt.Design_space(domain), 5)
+    Y = np.sum(X ** 2, axis=1, keepdims=True)
+    cost_model = GPyOpt.core.task.cost.CostModel('evaluation_time')
+    cost_model.update_cost_model(X, np.ones(len(X)))
+    model = GPyOpt.models.GPModel(optimize_restarts=1, max_iters=10, verbose=False)
+
+    for max_iters in [10, 0]:
+        model.max_iters = max_iters
+        X_next = calibration.make_batch_optimizer(domain, X, Y, model, cost_model).suggest_next_locations()
+        assert X_next.shape == (calibration.BATCH_SIZE, 2)
+        assert np.all((X_next[:, 0] >= 0.005) & (X_next[:, 0] <= 0.03))
+        assert np.all((X_next[:, 1] >= 0.) & (X_next[:, 1] <= 0.4))
+
+        X = np.vstack((X, X_next))
+        Y = np.vstack((Y, np.sum(X_next ** 2, axis=1, keepdims=True)))
+        cost_model.update_cost_model(X_next, np.ones(len(X_next)))
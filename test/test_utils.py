@@ -1,14 +1,26 @@
 # Confidential, Copyright 2021, Sony Corporation of America, All rights reserved.
 import itertools
 
-import pytest
-
 import pandemic_simulator as ps
 
 
-@pytest.mark.parametrize(['x', 'n'],
-                         [[i, j] for i, j in itertools.product(range(1, 10), range(1, 10))])
-def test_integer_partitions(x: int, n: int) -> None:
-    res = ps.utils.integer_partitions(x, n)
-    assert sum(res) == x
-    assert max(res) in [min(res) + 1, min(res)]
+def test_integer_partitions() -> None:
+    for x, n in itertools.product(range(1, 10), range(1, 10)):
+        res = ps.utils.integer_partitions(x, n)
+        assert sum(res) == x, (x, n)
+        assert max(res) in [min(res) + 1, min(res)], (x, n)
+
+
+def test_ordered_set() -> None:
+    s = ps.utils.OrderedSet([3, 1, 2, 1])
+    assert list(s) == [3, 1, 2]
+
+    s.add(0)
+    s.update([2, 4])
+    s.remove(1)
+    assert list(s) == [3, 2, 0, 4]
+    assert 1 not in s and 4 in s
+
+    assert s == ps.utils.OrderedSet([3, 2, 0, 4])
+    assert s != ps.utils.OrderedSet([4, 3, 2, 0])
+    assert s == {0, 2, 3, 4}